@@ -146,8 +146,9 @@ void cleanup_timeline(int **timeline, int capacity);
 // Helper functions
 const char* get_color_for_pid(int pid);
 const char* algorithm_name(Algorithm algorithm);
-void parse_arguments(int argc, char *argv[], Algorithm *algorithm, int *cpu_count, 
-                    int *time_quantum, char **input_file);
+void parse_arguments(int argc, char *argv[], Algorithm *algorithm, int *cpu_count,
+                    int *time_quantum, char **input_file, bool *repl_mode);
+void run_repl(void);
 
 
 // GLOBAL QUEUE
@@ -459,8 +460,8 @@ const char* algorithm_name(Algorithm algorithm) {
 /**
  * Parse command line arguments
  */
-void parse_arguments(int argc, char *argv[], Algorithm *algorithm, int *cpu_count, 
-                    int *time_quantum, char **input_file) {
+void parse_arguments(int argc, char *argv[], Algorithm *algorithm, int *cpu_count,
+                    int *time_quantum, char **input_file, bool *repl_mode) {
     for (int i = 1; i < argc; i++) {
         if (strcmp(argv[i], "-a") == 0 && i + 1 < argc) {
             i++;
@@ -477,13 +478,15 @@ void parse_arguments(int argc, char *argv[], Algorithm *algorithm, int *cpu_coun
             if (*time_quantum <= 0) *time_quantum = DEFAULT_TIME_QUANTUM;
         } else if (strcmp(argv[i], "-f") == 0 && i + 1 < argc) {
             *input_file = argv[++i];
+        } else if (strcmp(argv[i], "--repl") == 0) {
+            *repl_mode = true;
         } else {
-            fprintf(stderr, "Usage: %s -f <file> [-a <FCFS|RR|SRTF|SJF>] [-c <cpus>] [-q <quantum>]\n", argv[0]);
+            fprintf(stderr, "Usage: %s -f <file> [-a <FCFS|RR|SRTF|SJF>] [-c <cpus>] [-q <quantum>] [--repl]\n", argv[0]);
             exit(EXIT_FAILURE);
         }
     }
 
-    if (!(*input_file)) {
+    if (!(*input_file) && !(*repl_mode)) {
         fprintf(stderr, "Error: Input file required. Use -f <filename>\n");
         exit(EXIT_FAILURE);
     }
@@ -1105,29 +1108,103 @@ void print_results(Process *processes, int process_count, CPU *cpus, int cpu_cou
 
 /************************* MAIN FUNCTION *************************/
 
+/**
+ * Run simulations driven by commands on stdin (REPL mode)
+ *
+ * Each line has the form "<algorithm> <cpus> <quantum> <file>". The
+ * simulation output for a case is followed by an "--- END CASE ---"
+ * sentinel so a driver can feed many cases through one long-lived
+ * process instead of paying a fork/exec per case. The loop ends at EOF.
+ */
+void run_repl(void) {
+    char line[1024];
+    while (fgets(line, sizeof(line), stdin)) {
+        char algo_name[16];
+        int cpu_count = 1;
+        int time_quantum = DEFAULT_TIME_QUANTUM;
+        char filename[1024];
+        if (sscanf(line, "%15s %d %d %1023s", algo_name, &cpu_count,
+                   &time_quantum, filename) != 4) {
+            printf("Error: expected \"<algorithm> <cpus> <quantum> <file>\"\n");
+            printf("--- END CASE ---\n");
+            fflush(stdout);
+            continue;
+        }
+
+        Algorithm algorithm = FCFS;
+        if (strcmp(algo_name, "RR") == 0) algorithm = RR;
+        else if (strcmp(algo_name, "SRTF") == 0) algorithm = SRTF;
+        else if (strcmp(algo_name, "SJF") == 0) algorithm = SJF;
+        if (cpu_count <= 0) cpu_count = 1;
+        if (time_quantum <= 0) time_quantum = DEFAULT_TIME_QUANTUM;
+
+        init_queue(&FCFSQ);
+
+        Process *processes = NULL;
+        int process_count = 0;
+        load_processes(filename, &processes, &process_count);
+
+        if (process_count > 0) {
+            simulate(processes, process_count, cpu_count, algorithm, time_quantum);
+        } else {
+            printf("No processes loaded or simulation not possible.\n");
+        }
+
+        free(processes);
+
+        printf("--- END CASE ---\n");
+        fflush(stdout);
+    }
+}
+
 int main(int argc, char *argv[]) {
-    init_queue(&FCFSQ);
     Algorithm algorithm = FCFS;
     int cpu_count = 1;
     int time_quantum = DEFAULT_TIME_QUANTUM;
     char *input_file = NULL;
+    bool repl_mode = false;
 
     // Parse command line arguments
-    parse_arguments(argc, argv, &algorithm, &cpu_count, &time_quantum, &input_file);
-
-    // Load processes
-    Process *processes = NULL;
-    int process_count = 0;
-    load_processes(input_file, &processes, &process_count);
+    parse_arguments(argc, argv, &algorithm, &cpu_count, &time_quantum, &input_file,
+                    &repl_mode);
 
-    // Run simulation if processes were loaded successfully
-    if (process_count > 0) {
-        simulate(processes, process_count, cpu_count, algorithm, time_quantum);
-    } else {
-        printf("No processes loaded or simulation not possible.\n");
+    if (repl_mode) {
+        run_repl();
+        return EXIT_SUCCESS;
     }
 
-    // Clean up
-    free(processes);
+    // -f may name several comma-separated files; each is simulated
+    // independently in this one process so the test harness can batch many
+    // cases into a single launch. Batched runs are delimited by
+    // "--- BEGIN TEST <file> ---" markers; a single file produces the
+    // original unmarked output.
+    bool batched = input_file != NULL && strchr(input_file, ',') != NULL;
+    char *saveptr = NULL;
+    char *filename = batched ? strtok_r(input_file, ",", &saveptr) : input_file;
+
+    do {
+        if (batched) {
+            printf("--- BEGIN TEST %s ---\n", filename);
+        }
+        init_queue(&FCFSQ);
+
+        // Load processes
+        Process *processes = NULL;
+        int process_count = 0;
+        load_processes(filename, &processes, &process_count);
+
+        // Run simulation if processes were loaded successfully
+        if (process_count > 0) {
+            simulate(processes, process_count, cpu_count, algorithm, time_quantum);
+        } else {
+            printf("No processes loaded or simulation not possible.\n");
+        }
+
+        // Clean up
+        free(processes);
+
+        filename = batched ? strtok_r(NULL, ",", &saveptr) : NULL;
+    } while (filename != NULL);
+
     return EXIT_SUCCESS;
 }
@@ -44,983 +44,999 @@ Example:
 """
 
 import subprocess
-import csv
-import io
+import functools
+import itertools
+import json
+import tempfile
 import os
 import math
 import argparse
 import sys
-from typing import Dict, List, Tuple, Optional, Any, Union
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Optional, Any, Union
 
 # --- Configuration ---
 SCHEDULER_EXECUTABLE = './scheduler'  # Default path to scheduler executable
 FLOAT_TOLERANCE = 0.01  # Tolerance for floating-point comparisons
 DEFAULT_TIMEOUT = 10    # Default timeout in seconds
+BATCH_MARKER = '--- BEGIN TEST '  # Delimiter the scheduler prints between batched runs
+REPL_SENTINEL = '--- END CASE ---'  # Terminator the scheduler prints after each REPL case
+# Expected results sidecar, kept next to this script
+EXPECTED_RESULTS_FILE = Path(__file__).with_name('expected_results.json')
 
 # --- ANSI Color Codes ---
 _supports_color = hasattr(sys.stdout, "isatty") and sys.stdout.isatty() and sys.platform != 'win32'
 
-COLOR_GREEN = "\033[92m" if _supports_color else ""
-COLOR_RED = "\033[91m" if _supports_color else ""
-COLOR_YELLOW = "\033[93m" if _supports_color else ""
-COLOR_CYAN = "\033[96m" if _supports_color else ""
-COLOR_BOLD = "\033[1m" if _supports_color else ""
-COLOR_RESET = "\033[0m" if _supports_color else ""
+
+class Colors:
+    """ANSI color codes, computed once; all empty off-terminal."""
+    GREEN = "\033[92m" if _supports_color else ""
+    RED = "\033[91m" if _supports_color else ""
+    YELLOW = "\033[93m" if _supports_color else ""
+    CYAN = "\033[96m" if _supports_color else ""
+    BOLD = "\033[1m" if _supports_color else ""
+    RESET = "\033[0m" if _supports_color else ""
+
+
+if _supports_color:
+    def red(s: str) -> str: return f"{Colors.RED}{s}{Colors.RESET}"
+    def green(s: str) -> str: return f"{Colors.GREEN}{s}{Colors.RESET}"
+    def yellow(s: str) -> str: return f"{Colors.YELLOW}{s}{Colors.RESET}"
+    def cyan(s: str) -> str: return f"{Colors.CYAN}{s}{Colors.RESET}"
+    def bold(s: str) -> str: return f"{Colors.BOLD}{s}{Colors.RESET}"
+else:
+    # Identity helpers: zero string building on monochrome terminals
+    red = green = yellow = cyan = bold = lambda s: s
 
 # --- Types ---
-TestCase = Tuple[str, str, int, int, str, Dict[str, List[Dict[str, str]]]]
-ResultsDict = Dict[str, List[Dict[str, str]]]
+# A CSV field once parsed: int or float for numeric columns, str for
+# sentinels like 'N/A'
+Value = Union[int, float, str]
+# A results section pivoted into column-oriented (SoA) form: one tuple of
+# values per column instead of one dict or list per row. Both the parsed
+# scheduler output and the expected results use this shape, so a matching
+# column is confirmed by a single tuple comparison.
+Section = Dict[str, Tuple[Value, ...]]
+ResultsDict = Dict[str, Section]
+ActualResults = Dict[str, Section]
+TestCase = Tuple[str, str, int, int, str, ResultsDict]
+
+# Lock guarding stdout so colored output from parallel workers doesn't interleave
+_print_lock = threading.Lock()
 
 
 # --- Helper Functions ---
-def run_scheduler(executable: str, algorithm: str, cpus: int, quantum: int, 
-                  input_file: str, verbose: bool = False) -> Optional[str]:
+@functools.lru_cache(maxsize=None)
+def build_cmd(executable: str, algorithm: str, cpus: int, quantum: int) -> Tuple[str, ...]:
+    """
+    Build the fixed part of a scheduler command line, memoized per
+    (executable, algorithm, cpus, quantum) combination.
+
+    Only a handful of combinations exist across the whole suite, so caching
+    them keeps the int-to-str conversions and list construction out of the
+    per-invocation path; run_scheduler just appends -f and the input file.
+
+    Args:
+        executable: Path to the scheduler executable
+        algorithm: Scheduling algorithm (FCFS, SJF, SRTF, RR)
+        cpus: Number of CPUs
+        quantum: Time quantum for Round Robin (ignored for other algorithms)
+
+    Returns:
+        The command-line prefix as a tuple of arguments
+    """
+    cmd = (executable, '-a', algorithm, '-c', str(cpus))
+    if algorithm == 'RR':
+        cmd += ('-q', str(quantum))
+    return cmd
+
+
+def run_scheduler(executable: str, algorithm: str, cpus: int, quantum: int,
+                  input_file: Union[str, List[str]], verbose: bool = False,
+                  report: Optional[List[str]] = None) -> Optional[List[str]]:
     """
     Run the CPU scheduler executable with the specified parameters.
-    
+
+    Non-verbose runs are memoized on the full invocation plus the
+    executable's mtime (see _cached_scheduler_run), so re-running the same
+    case in a debug loop within one process skips the subprocess entirely;
+    a recompile invalidates the cache.
+
     Args:
         executable: Path to the scheduler executable
         algorithm: Scheduling algorithm (FCFS, SJF, SRTF, RR)
         cpus: Number of CPUs
         quantum: Time quantum for Round Robin (ignored for other algorithms)
-        input_file: Path to the process input file
+        input_file: Path to the process input file, or a list of paths to run
+                    as one batched invocation (passed as -f file1,file2,...)
         verbose: Whether to print the scheduler's output
-        
+        report: Optional list to collect messages into instead of printing
+                (used by parallel workers to keep output from interleaving)
+
     Returns:
-        The stdout output from the scheduler, or None if execution failed
+        The stdout output from the scheduler as a list of lines, or None if
+        execution failed
     """
-    cmd = [
-        executable,
-        '-f', input_file,
-        '-a', algorithm,
-        '-c', str(cpus)
-    ]
-    if algorithm == 'RR':
-        cmd.extend(['-q', str(quantum)])
+    if not isinstance(input_file, str):
+        input_file = ','.join(input_file)
+
+    if verbose:
+        # Verbose runs stay uncached so their prints re-fire every time
+        return _run_scheduler(executable, algorithm, cpus, quantum,
+                              input_file, True, report)
+
+    output, messages = _cached_scheduler_run(executable, algorithm, cpus,
+                                             quantum, input_file,
+                                             os.stat(executable).st_mtime_ns)
+    if messages:
+        if report is not None:
+            report.extend(messages)
+        else:
+            for message in messages:
+                print(message)
+    return list(output) if output is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_scheduler_run(executable: str, algorithm: str, cpus: int,
+                          quantum: int, input_file: str,
+                          exe_mtime_ns: int) -> Tuple[Optional[Tuple[str, ...]],
+                                                      Tuple[str, ...]]:
+    """
+    Memoized scheduler invocation; exe_mtime_ns keys out stale binaries.
+
+    Args:
+        executable: Path to the scheduler executable
+        algorithm: Scheduling algorithm (FCFS, SJF, SRTF, RR)
+        cpus: Number of CPUs
+        quantum: Time quantum for Round Robin
+        input_file: Input file path(s), comma-joined if batched
+        exe_mtime_ns: The executable's st_mtime_ns at call time
+
+    Returns:
+        Tuple of (output lines or None, diagnostic messages)
+    """
+    messages: List[str] = []
+    output = _run_scheduler(executable, algorithm, cpus, quantum, input_file,
+                            False, messages)
+    return (tuple(output) if output is not None else None, tuple(messages))
+
+
+def _run_scheduler(executable: str, algorithm: str, cpus: int, quantum: int,
+                   input_file: str, verbose: bool,
+                   report: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Launch one scheduler subprocess and collect its output.
+
+    The child's stdout is consumed line by line as it is produced rather than
+    buffered into one large string, so Python-side work overlaps with the
+    scheduler's execution and no full-output copy (or splitlines() pass) is
+    needed afterwards.
 
+    Args:
+        executable: Path to the scheduler executable
+        algorithm: Scheduling algorithm (FCFS, SJF, SRTF, RR)
+        cpus: Number of CPUs
+        quantum: Time quantum for Round Robin
+        input_file: Input file path(s), comma-joined if batched
+        verbose: Whether to print the scheduler's output
+        report: Optional list to collect messages into instead of printing
+
+    Returns:
+        The stdout output from the scheduler as a list of lines, or None if
+        execution failed
+    """
+    echo = report.append if report is not None else print
+    if not isinstance(input_file, str):
+        input_file = ','.join(input_file)
+    cmd = [*build_cmd(executable, algorithm, cpus, quantum), '-f', input_file]
+
+    # The executable's existence is checked once at startup, so no
+    # per-invocation FileNotFoundError handling is needed here
+    if verbose:
+        echo(f"Running: {' '.join(cmd)}")
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, bufsize=1)
+
+    # Kill the child if it runs past the timeout; iterating its stdout would
+    # otherwise block forever on a hung scheduler.
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(DEFAULT_TIMEOUT, kill_on_timeout)
+    watchdog.start()
     try:
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=DEFAULT_TIMEOUT)
-        print("Scheduler execution successful.")
-        
-        if verbose:
-            print("\nScheduler Output:")
-            print("-" * 40)
-            print(result.stdout)
-            print("-" * 40)
-            
-        return result.stdout
-    except FileNotFoundError:
-        print(f"{COLOR_RED}Error: Scheduler executable not found at '{executable}'{COLOR_RESET}")
+        output_lines = [line.rstrip('\n') for line in proc.stdout]
+    finally:
+        watchdog.cancel()
+    stderr = proc.stderr.read()
+    returncode = proc.wait()
+
+    if timed_out.is_set():
+        echo(red(f"Error: Scheduler process timed out after {DEFAULT_TIMEOUT}s."))
         return None
-    except subprocess.CalledProcessError as e:
-        print(f"{COLOR_RED}Error running scheduler: {e}{COLOR_RESET}")
-        print(f"Stderr:\n{e.stderr}")
-        return None
-    except subprocess.TimeoutExpired:
-        print(f"{COLOR_RED}Error: Scheduler process timed out after {DEFAULT_TIMEOUT}s.{COLOR_RESET}")
+    if returncode != 0:
+        echo(red(f"Error running scheduler: exit status {returncode}"))
+        echo(f"Stderr:\n{stderr}")
         return None
 
+    if verbose:
+        echo("Scheduler execution successful.")
+        echo("\nScheduler Output:")
+        echo("-" * 40)
+        echo('\n'.join(output_lines))
+        echo("-" * 40)
+
+    return output_lines
 
-def parse_csv_section(output_lines: List[str], section_header: str) -> Optional[List[Dict[str, str]]]:
+
+def typed_value(value: str) -> Value:
     """
-    Parse a specific CSV section from the scheduler's output.
-    
-    This function extracts and parses a CSV section with the given header from 
-    the scheduler's output lines, handling the format where CSV data is preceded 
-    by section headers and may include blank lines.
-    
+    Convert a CSV field to an int or float once at parse time.
+
+    Non-numeric fields (e.g. 'N/A') are returned unchanged, so comparisons
+    later are pure numeric operations with no repeated int()/float() calls.
+
     Args:
-        output_lines: List of text output lines from the scheduler
-        section_header: Text header identifying the section to parse
-        
+        value: Raw CSV field text
+
     Returns:
-        List of dictionaries, each representing a row of CSV data with column names 
-        as keys, or None if parsing fails
+        The value as int, float, or the original string
     """
-    data = []
-    in_section = False
-    header_found = False
-    csv_content = io.StringIO()
-
-    for line in output_lines:
-        stripped_line = line.strip()
-        if section_header in stripped_line:
-            in_section = True
-            header_found = False  # Reset header flag when section starts
-            csv_content = io.StringIO()  # Reset content for new section
-            continue
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
 
-        if in_section:
-            # Stop if we hit the end marker or another section header
-            if "--- End CSV Output ---" in stripped_line or \
-               ("--- CSV Output ---" in stripped_line and section_header not in stripped_line) or \
-               ("Stats (CSV):" in stripped_line and section_header not in stripped_line):
-                break
-                
-            # Skip blank lines within the section before the header
-            if not stripped_line and not header_found:
-                continue
-                
-            # The first non-blank line after the header is the CSV header
-            if not header_found and stripped_line:
-                # Check if it looks like a CSV header (contains commas)
-                if ',' in stripped_line:
-                    header_found = True
-                    csv_content.write(stripped_line + '\n')
-                # else: skip potential non-header lines like section titles
-            elif header_found and stripped_line:
-                csv_content.write(stripped_line + '\n')
-
-    csv_content.seek(0)  # Rewind the string buffer
-    if header_found:
-        try:
-            # Use DictReader for easier access by column name
-            reader = csv.DictReader(csv_content)
-            data = [row for row in reader]
-        except Exception as e:
-            print(f"{COLOR_RED}Error parsing CSV for section '{section_header}': {e}{COLOR_RESET}")
-            print(f"Content attempted to parse:\n{csv_content.getvalue()}")
-            return None  # Indicate parsing failure
 
-    return data
+# Section headers the scheduler prints before each CSV block, mapped to the
+# keys used in the results dictionary.
+SECTION_HEADERS = {
+    'Process Stats (CSV):': 'process',
+    'CPU Stats (CSV):': 'cpu',
+    'Average Stats (CSV):': 'average',
+}
 
 
-def parse_all_csv(output: str) -> Optional[ResultsDict]:
+def parse_all_csv(output_lines: List[str], report: Optional[List[str]] = None) -> Optional[ActualResults]:
     """
-    Parse all CSV sections from the scheduler's output.
-    
-    Extracts the three main CSV sections: process stats, CPU stats, and average stats.
-    
+    Parse all CSV sections from the scheduler's output in a single pass.
+
+    One loop over the output recognizes all three section headers (process,
+    CPU, and average stats) and accumulates each section's CSV lines, instead
+    of rescanning the full output once per section.
+
     Args:
-        output: The complete stdout text from the scheduler
-        
+        output_lines: The scheduler's stdout as a list of lines
+        report: Optional list to collect messages into instead of printing
+
     Returns:
         Dictionary containing the parsed data for each section, or None if parsing failed
     """
-    if output is None:
+    echo = report.append if report is not None else print
+    if output_lines is None:
         return None
 
-    lines = output.splitlines()
-    results = {}
+    # Accumulate raw CSV lines per section
+    buffers: Dict[str, List[str]] = {name: [] for name in SECTION_HEADERS.values()}
+    current: Optional[List[str]] = None
+    header_found = False
 
-    results['process'] = parse_csv_section(lines, 'Process Stats (CSV):')
-    results['cpu'] = parse_csv_section(lines, 'CPU Stats (CSV):')
-    results['average'] = parse_csv_section(lines, 'Average Stats (CSV):')
+    for line in output_lines:
+        stripped_line = line.strip()
+        # Cheap suffix test guards the header lookup; the bulk of the output
+        # (timeline art, human-readable tables) can't be a section header
+        if stripped_line.endswith('(CSV):'):
+            section = SECTION_HEADERS.get(stripped_line)
+            if section is not None:
+                current = buffers[section]
+                current.clear()  # Reset content if a section header repeats
+                header_found = False
+                continue
+        if current is None or not stripped_line:
+            continue
+        # '--- CSV Output ---' / '--- End CSV Output ---' delimiters end a section
+        if stripped_line.startswith('---'):
+            current = None
+            continue
+        # The first comma-bearing line of a section is its CSV header;
+        # other non-blank lines before it (section titles) are skipped
+        if header_found or ',' in stripped_line:
+            header_found = True
+            current.append(stripped_line)
+
+    # Parse each accumulated section once, pivoting rows into columns
+    results: Dict[str, Optional[Section]] = {}
+    for name, csv_lines in buffers.items():
+        if not csv_lines:
+            results[name] = {}
+            continue
+        try:
+            # The scheduler's CSV has a fixed schema with no quoting or
+            # embedded commas, so a plain split beats the csv module here
+            header = csv_lines[0].split(',')
+            # map() runs the conversion loop in C; only the typed_value
+            # calls themselves execute Python bytecode
+            rows = [tuple(map(typed_value, line.split(','))) for line in csv_lines[1:]]
+            columns = list(zip(*rows)) if rows else [()] * len(header)
+            results[name] = dict(zip(header, columns))
+        except Exception as e:
+            echo(red(f"Error parsing CSV for section '{name}': {e}"))
+            echo("Content attempted to parse:\n" + '\n'.join(csv_lines))
+            results[name] = None
 
     # Check if parsing failed for any section
     if results['process'] is None or results['cpu'] is None or results['average'] is None:
-        print(f"{COLOR_RED}CSV Parsing failed for one or more sections.{COLOR_RESET}")
+        echo(red("CSV Parsing failed for one or more sections."))
         return None
-    if not results['process'] or not results['cpu'] or not results['average']:
-        print(f"{COLOR_YELLOW}Warning: One or more CSV sections were empty.{COLOR_RESET}")
+    if not (section_length(results['process']) and section_length(results['cpu'])
+            and section_length(results['average'])):
+        echo(yellow("Warning: One or more CSV sections were empty."))
 
     return results
 
 
-def compare_floats(val1_str: str, val2_str: str, tolerance: float) -> bool:
+def section_length(section: Section) -> int:
+    """Number of data rows in a parsed (column-oriented) section."""
+    return len(next(iter(section.values()), ()))
+
+
+def compare_floats(val1: Value, val2: Value, tolerance: float) -> bool:
     """
-    Compare two floating-point values with tolerance.
-    
+    Compare two already-typed floating-point values with tolerance.
+
     Args:
-        val1_str: First value as string
-        val2_str: Second value as string
+        val1: First value (numeric, or a sentinel string like 'N/A')
+        val2: Second value (numeric, or a sentinel string like 'N/A')
         tolerance: Acceptable difference between values
-        
+
     Returns:
         True if the values are equal within tolerance, False otherwise
     """
-    if val1_str == 'N/A' and val2_str == 'N/A':
-        return True
-    if val1_str == 'N/A' or val2_str == 'N/A':
-        return False
-    try:
-        return math.isclose(float(val1_str), float(val2_str), abs_tol=tolerance)
-    except ValueError:
-        return False  # Cannot convert to float
+    if isinstance(val1, str) or isinstance(val2, str):
+        return val1 == val2  # Sentinels like 'N/A' only match themselves
+    return math.isclose(val1, val2, abs_tol=tolerance)
 
 
-def compare_ints(val1_str: str, val2_str: str) -> bool:
+def compare_ints(val1: Value, val2: Value) -> bool:
     """
-    Compare two integer values.
-    
+    Compare two already-typed integer values.
+
     Args:
-        val1_str: First value as string
-        val2_str: Second value as string
-        
+        val1: First value (numeric, or a sentinel string like 'N/A')
+        val2: Second value (numeric, or a sentinel string like 'N/A')
+
     Returns:
         True if the values are equal, False otherwise
     """
-    if val1_str == 'N/A' and val2_str == 'N/A':
-        return True
-    if val1_str == 'N/A' or val2_str == 'N/A':
-        return False
-    try:
-        return int(val1_str) == int(val2_str)
-    except ValueError:
-        return False  # Cannot convert to int
+    return val1 == val2
 
 
-def compare_results(actual: ResultsDict, expected: ResultsDict) -> List[str]:
+# Column classification for comparisons: integer columns use exact equality,
+# float columns are compared with FLOAT_TOLERANCE
+INT_PROCESS_COLS = frozenset({"PID", "Arrival", "Burst", "Priority", "Start",
+                              "Finish", "Turnaround", "Waiting", "Response"})
+INT_CPU_COLS = frozenset({"CPU_ID", "BusyTime", "IdleTime"})
+FLOAT_AVERAGE_COLS = frozenset({"AvgTurnaround", "AvgWaiting", "AvgResponse"})
+
+
+def compare_column(label: str, col: str, act_col: Tuple[Value, ...],
+                   exp_col: Tuple[Value, ...], cmp: Callable[[Value, Value], bool],
+                   mismatches: List[str]) -> None:
+    """
+    Compare one column of a section, appending row-level mismatch messages.
+
+    The fast path is a single tuple comparison; only a column that differs
+    somewhere is walked element by element.
+
+    Args:
+        label: Section label used in mismatch messages (e.g. 'Process')
+        col: Column name
+        act_col: Actual column values
+        exp_col: Expected column values
+        cmp: Element comparator used when the fast path fails
+        mismatches: List to append mismatch messages to
+    """
+    if act_col == exp_col:
+        return
+    for i, (act_val, exp_val) in enumerate(zip(act_col, exp_col)):
+        if not cmp(act_val, exp_val):
+            mismatches.append(f"{label} row {i+1}, Col '{col}': "
+                              f"Expected '{exp_val}', Got '{act_val}'")
+
+
+def compare_results(actual: ActualResults, expected: ResultsDict) -> List[str]:
     """
     Compare actual scheduler results against expected results.
-    
+
     Performs detailed comparison of process stats, CPU stats, and averages,
-    generating informative mismatch messages.
-    
+    generating informative mismatch messages. Both sides are held in
+    column-oriented form, so each column is checked with one tuple
+    comparison; the per-row message path runs only for columns that differ.
+
     Args:
-        actual: Dictionary of actual results from the scheduler
-        expected: Dictionary of expected results
-        
+        actual: Dictionary of parsed column-oriented sections from the scheduler
+        expected: Dictionary of expected column-oriented sections
+
     Returns:
         List of mismatch messages, empty if all results match expectations
     """
     mismatches = []
+    isclose = lambda v1, v2: compare_floats(v1, v2, FLOAT_TOLERANCE)
+
+    # Bind each section to a local once instead of re-running .get() (and
+    # constructing its default) at every use inside the comparison loops
+    act_proc = actual.get('process', {})
+    exp_proc = expected.get('process', {})
+    act_cpu = actual.get('cpu', {})
+    exp_cpu = expected.get('cpu', {})
+    act_avg = actual.get('average', {})
+    exp_avg = expected.get('average', {})
 
     # Compare Process Stats
-    if len(actual.get('process', [])) != len(expected.get('process', [])):
-        mismatches.append(f"Process count mismatch: Expected {len(expected.get('process', []))}, "
-                          f"Got {len(actual.get('process', []))}")
+    n_act_proc = section_length(act_proc)
+    n_exp_proc = section_length(exp_proc)
+    if n_act_proc != n_exp_proc:
+        mismatches.append(f"Process count mismatch: Expected {n_exp_proc}, "
+                          f"Got {n_act_proc}")
     else:
-        # Ensure expected columns exist before trying to access them
-        expected_process_cols = expected.get('process', [{}])[0].keys() if expected.get('process') else []
-        for i, (act_row, exp_row) in enumerate(zip(actual.get('process', []), expected.get('process', []))):
-            for col in expected_process_cols:  # Iterate over expected columns
-                if col not in act_row:
-                    mismatches.append(f"Process row {i+1}: Missing column '{col}' in actual output")
-                    continue
-                    
-                # Determine comparison type based on column name
-                if col in ["PID", "Arrival", "Burst", "Priority", "Start", "Finish", "Turnaround", "Waiting", "Response"]:
-                    if not compare_ints(act_row[col], exp_row[col]):
-                        mismatches.append(f"Process row {i+1}, Col '{col}': "
-                                          f"Expected '{exp_row[col]}', Got '{act_row[col]}'")
+        for col, exp_col in exp_proc.items():
+            if col not in act_proc:
+                mismatches.append(f"Process: Missing column '{col}' in actual output")
+            elif col in INT_PROCESS_COLS:
+                compare_column("Process", col, act_proc[col], exp_col, compare_ints, mismatches)
 
     # Compare CPU Stats
-    if len(actual.get('cpu', [])) != len(expected.get('cpu', [])):
-        mismatches.append(f"CPU count mismatch: Expected {len(expected.get('cpu', []))}, "
-                          f"Got {len(actual.get('cpu', []))}")
+    n_act_cpu = section_length(act_cpu)
+    n_exp_cpu = section_length(exp_cpu)
+    if n_act_cpu != n_exp_cpu:
+        mismatches.append(f"CPU count mismatch: Expected {n_exp_cpu}, "
+                          f"Got {n_act_cpu}")
     else:
-        expected_cpu_cols = expected.get('cpu', [{}])[0].keys() if expected.get('cpu') else []
-        for i, (act_row, exp_row) in enumerate(zip(actual.get('cpu', []), expected.get('cpu', []))):
-            for col in expected_cpu_cols:
-                if col not in act_row:
-                    mismatches.append(f"CPU row {i+1}: Missing column '{col}' in actual output")
-                    continue
-                    
-                if col in ["CPU_ID", "BusyTime", "IdleTime"]:
-                    if not compare_ints(act_row[col], exp_row[col]):
-                        mismatches.append(f"CPU row {i+1}, Col '{col}': "
-                                          f"Expected '{exp_row[col]}', Got '{act_row[col]}'")
-                elif col in ["Utilization%"]:
-                    if not compare_floats(act_row[col], exp_row[col], FLOAT_TOLERANCE):
-                        mismatches.append(f"CPU row {i+1}, Col '{col}': "
-                                          f"Expected '{exp_row[col]}', Got '{act_row[col]}'")
+        for col, exp_col in exp_cpu.items():
+            if col not in act_cpu:
+                mismatches.append(f"CPU: Missing column '{col}' in actual output")
+            elif col in INT_CPU_COLS:
+                compare_column("CPU", col, act_cpu[col], exp_col, compare_ints, mismatches)
+
+        # Utilization% is fully determined by the integer BusyTime/IdleTime
+        # columns checked above, so it carries no expected float constants;
+        # instead verify the scheduler's formatted value is consistent with
+        # its own integer counters.
+        busy_col = act_cpu.get('BusyTime')
+        idle_col = act_cpu.get('IdleTime')
+        util_col = act_cpu.get('Utilization%')
+        if busy_col and idle_col and util_col:
+            for i, (busy, idle, util) in enumerate(zip(busy_col, idle_col, util_col)):
+                total = busy + idle
+                derived = busy * 100.0 / total if total else 0.0
+                if not isclose(util, derived):
+                    mismatches.append(f"CPU row {i+1}, Col 'Utilization%': "
+                                      f"Expected '{derived:.2f}', Got '{util}'")
 
     # Compare Average Stats
-    if len(actual.get('average', [])) != 1 or len(expected.get('average', [])) != 1:
+    n_act_avg = section_length(act_avg)
+    if n_act_avg != 1 or section_length(exp_avg) != 1:
         mismatches.append(f"Average stats row count mismatch: "
-                          f"Expected 1, Got {len(actual.get('average', []))}")
-    elif actual.get('average') and expected.get('average'):  # Check if lists are not empty
-        expected_avg_cols = expected['average'][0].keys()
-        act_avg = actual['average'][0]
-        exp_avg = expected['average'][0]
-        
-        for col in expected_avg_cols:
+                          f"Expected 1, Got {n_act_avg}")
+    else:
+        for col, exp_col in exp_avg.items():
             if col not in act_avg:
                 mismatches.append(f"Average stats: Missing column '{col}' in actual output")
                 continue
-                
-            if col in ["AvgTurnaround", "AvgWaiting", "AvgResponse"]:
-                if not compare_floats(act_avg[col], exp_avg[col], FLOAT_TOLERANCE):
+
+            if col in FLOAT_AVERAGE_COLS:
+                if not compare_floats(act_avg[col][0], exp_col[0], FLOAT_TOLERANCE):
                     mismatches.append(f"Average stats, Col '{col}': "
-                                      f"Expected '{exp_avg[col]}', Got '{act_avg[col]}'")
+                                      f"Expected '{exp_col[0]}', Got '{act_avg[col][0]}'")
 
     return mismatches
 
 
 # --- Test File Generation Functions ---
 
-def create_test_files() -> Dict[str, str]:
-    """
-    Create all test input files needed for the test cases.
-    
-    Returns:
-        Dictionary mapping test file identifiers to their file paths
-    """
-    test_files = {}
-    
+# Test input files as prebuilt (path, content) constants so each file is
+# written with a single call instead of line-by-line writes.
+TEST_FILE_CONTENTS = {
     # Basic test file
-    test_files['basic'] = 'test_processes_basic.txt'
-    with open(test_files['basic'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 5 1\n")
-        f.write("2 2 3 2\n")
-        f.write("3 4 2 1\n")
+    'basic': ('test_processes_basic.txt',
+              "# PID Arrival Burst Priority\n"
+              "1 0 5 1\n"
+              "2 2 3 2\n"
+              "3 4 2 1\n"),
 
     # Priority test file
-    test_files['priority'] = 'test_processes_priority.txt'
-    with open(test_files['priority'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 5 2\n")  # P1: Higher priority than P2
-        f.write("2 2 3 1\n")  # P2: Lower priority
-        f.write("3 2 4 3\n")  # P3: Highest priority, arrives same time as P2
-        f.write("4 5 2 2\n")  # P4: Arrives later
+    'priority': ('test_processes_priority.txt',
+                 "# PID Arrival Burst Priority\n"
+                 "1 0 5 2\n"  # P1: Higher priority than P2
+                 "2 2 3 1\n"  # P2: Lower priority
+                 "3 2 4 3\n"  # P3: Highest priority, arrives same time as P2
+                 "4 5 2 2\n"),  # P4: Arrives later
 
     # Burst time ties
-    test_files['ties'] = 'test_processes_ties.txt'
-    with open(test_files['ties'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 3 1\n")    # Arrives at 0, burst=3, lowest priority
-        f.write("2 0 3 2\n")    # Arrives at 0, burst=3, medium priority
-        f.write("3 0 3 3\n")    # Arrives at 0, burst=3, highest priority
+    'ties': ('test_processes_ties.txt',
+             "# PID Arrival Burst Priority\n"
+             "1 0 3 1\n"    # Arrives at 0, burst=3, lowest priority
+             "2 0 3 2\n"    # Arrives at 0, burst=3, medium priority
+             "3 0 3 3\n"),  # Arrives at 0, burst=3, highest priority
 
     # Simultaneous arrivals
-    test_files['simultaneous'] = 'test_processes_simultaneous.txt'
-    with open(test_files['simultaneous'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 4 2\n")
-        f.write("2 0 3 1\n")
-        f.write("3 0 2 3\n")
+    'simultaneous': ('test_processes_simultaneous.txt',
+                     "# PID Arrival Burst Priority\n"
+                     "1 0 4 2\n"
+                     "2 0 3 1\n"
+                     "3 0 2 3\n"),
 
     # Scenario two (longer test case)
-    test_files['scenario_two'] = 'test_processes_scenario_two.txt'
-    with open(test_files['scenario_two'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 8 2\n")
-        f.write("2 1 2 3\n")
-        f.write("3 2 4 1\n")
-        f.write("4 3 6 2\n")
-        f.write("5 4 7 3\n")
-        f.write("6 5 5 1\n")
+    'scenario_two': ('test_processes_scenario_two.txt',
+                     "# PID Arrival Burst Priority\n"
+                     "1 0 8 2\n"
+                     "2 1 2 3\n"
+                     "3 2 4 1\n"
+                     "4 3 6 2\n"
+                     "5 4 7 3\n"
+                     "6 5 5 1\n"),
 
     # Many short jobs test
-    test_files['short_jobs'] = 'test_processes_short_jobs.txt'
-    with open(test_files['short_jobs'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 10 2\n")     # Long job, medium priority
-        f.write("2 1 12 1\n")     # Long job, low priority
-        f.write("3 2 1 3\n")      # Short job, high priority
-        f.write("4 3 2 2\n")      # Short job, medium priority
-        f.write("5 4 1 3\n")      # Short job, high priority
-        f.write("6 5 1 1\n")      # Short job, low priority
-        f.write("7 6 2 2\n")      # Short job, medium priority
-        f.write("8 7 1 3\n")      # Short job, high priority
-        f.write("9 8 2 1\n")      # Short job, low priority
-        f.write("10 9 1 2\n")     # Short job, medium priority
+    'short_jobs': ('test_processes_short_jobs.txt',
+                   "# PID Arrival Burst Priority\n"
+                   "1 0 10 2\n"    # Long job, medium priority
+                   "2 1 12 1\n"    # Long job, low priority
+                   "3 2 1 3\n"     # Short job, high priority
+                   "4 3 2 2\n"     # Short job, medium priority
+                   "5 4 1 3\n"     # Short job, high priority
+                   "6 5 1 1\n"     # Short job, low priority
+                   "7 6 2 2\n"     # Short job, medium priority
+                   "8 7 1 3\n"     # Short job, high priority
+                   "9 8 2 1\n"     # Short job, low priority
+                   "10 9 1 2\n"),  # Short job, medium priority
 
     # Priority inversion scenario
-    test_files['priority_inversion'] = 'test_processes_priority_inversion.txt'
-    with open(test_files['priority_inversion'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 6 1\n")      # Low priority, arrives first
-        f.write("2 1 2 5\n")      # Highest priority, arrives second
-        f.write("3 2 3 4\n")      # High priority, arrives third
-        f.write("4 3 1 3\n")      # Medium priority
-        f.write("5 4 2 2\n")      # Low-medium priority
-    
-        # --- NEW EDGE-CASE TEST FILES ---
+    'priority_inversion': ('test_processes_priority_inversion.txt',
+                           "# PID Arrival Burst Priority\n"
+                           "1 0 6 1\n"    # Low priority, arrives first
+                           "2 1 2 5\n"    # Highest priority, arrives second
+                           "3 2 3 4\n"    # High priority, arrives third
+                           "4 3 1 3\n"    # Medium priority
+                           "5 4 2 2\n"),  # Low-medium priority
+
+    # --- NEW EDGE-CASE TEST FILES ---
 
     # Idle gap before first arrival (CPU should be idle initially)
-    test_files['idle_gap'] = 'test_processes_idle_gap.txt'
-    with open(test_files['idle_gap'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 3 2 1\n")
-        f.write("2 5 1 1\n")
+    'idle_gap': ('test_processes_idle_gap.txt',
+                 "# PID Arrival Burst Priority\n"
+                 "1 3 2 1\n"
+                 "2 5 1 1\n"),
 
     # More CPUs than processes + simultaneous arrivals (tests dispatch + idle CPUs)
-    test_files['few_procs_many_cpus'] = 'test_processes_few_procs_many_cpus.txt'
-    with open(test_files['few_procs_many_cpus'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 4 1\n")
-        f.write("2 0 2 2\n")
-        f.write("3 0 1 3\n")
+    'few_procs_many_cpus': ('test_processes_few_procs_many_cpus.txt',
+                            "# PID Arrival Burst Priority\n"
+                            "1 0 4 1\n"
+                            "2 0 2 2\n"
+                            "3 0 1 3\n"),
 
     # FCFS input file intentionally unsorted by arrival (scheduler must not trust file order)
-    test_files['unsorted_arrivals'] = 'test_processes_unsorted_arrivals.txt'
-    with open(test_files['unsorted_arrivals'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("2 5 1 1\n")
-        f.write("1 0 3 1\n")
-        f.write("3 2 2 1\n")
+    'unsorted_arrivals': ('test_processes_unsorted_arrivals.txt',
+                          "# PID Arrival Burst Priority\n"
+                          "2 5 1 1\n"
+                          "1 0 3 1\n"
+                          "3 2 2 1\n"),
 
     # SJF tie on burst: choose higher priority, then lower PID
-    test_files['sjf_tie_priority'] = 'test_processes_sjf_tie_priority.txt'
-    with open(test_files['sjf_tie_priority'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 3 1\n")
-        f.write("2 0 3 5\n")
-        f.write("3 0 1 2\n")
+    'sjf_tie_priority': ('test_processes_sjf_tie_priority.txt',
+                         "# PID Arrival Burst Priority\n"
+                         "1 0 3 1\n"
+                         "2 0 3 5\n"
+                         "3 0 1 2\n"),
 
     # SRTF multiple preemption chain
-    test_files['srtf_preempt_chain'] = 'test_processes_srtf_preempt_chain.txt'
-    with open(test_files['srtf_preempt_chain'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 8 1\n")
-        f.write("2 1 4 1\n")
-        f.write("3 2 2 1\n")
+    'srtf_preempt_chain': ('test_processes_srtf_preempt_chain.txt',
+                           "# PID Arrival Burst Priority\n"
+                           "1 0 8 1\n"
+                           "2 1 4 1\n"
+                           "3 2 2 1\n"),
 
     # SRTF tie on remaining time: break tie via priority, then PID
-    test_files['srtf_equal_remaining'] = 'test_processes_srtf_equal_remaining.txt'
-    with open(test_files['srtf_equal_remaining'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 4 1\n")
-        f.write("2 1 3 5\n")
+    'srtf_equal_remaining': ('test_processes_srtf_equal_remaining.txt',
+                             "# PID Arrival Burst Priority\n"
+                             "1 0 4 1\n"
+                             "2 1 3 5\n"),
 
     # Single process that arrives late (tests idle and correctness of stats)
-    test_files['single_late'] = 'test_processes_single_late.txt'
-    with open(test_files['single_late'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 5 3 1\n")
+    'single_late': ('test_processes_single_late.txt',
+                    "# PID Arrival Burst Priority\n"
+                    "1 5 3 1\n"),
 
     # RR quantum=1 with simultaneous arrivals (tests extreme switching + tie-breaking)
-    test_files['rr_q1_simul'] = 'test_processes_rr_q1_simul.txt'
-    with open(test_files['rr_q1_simul'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 0 2 1\n")
-        f.write("2 0 2 2\n")
+    'rr_q1_simul': ('test_processes_rr_q1_simul.txt',
+                    "# PID Arrival Burst Priority\n"
+                    "1 0 2 1\n"
+                    "2 0 2 2\n"),
 
     # RR with idle gap then multi-quantum completion
-    test_files['rr_idle_single'] = 'test_processes_rr_idle_single.txt'
-    with open(test_files['rr_idle_single'], 'w') as f:
-        f.write("# PID Arrival Burst Priority\n")
-        f.write("1 3 3 1\n")
+    'rr_idle_single': ('test_processes_rr_idle_single.txt',
+                       "# PID Arrival Burst Priority\n"
+                       "1 3 3 1\n"),
+}
+
+
+def create_test_files(base_dir: Optional[str] = None) -> Dict[str, str]:
+    """
+    Create all test input files needed for the test cases.
+
+    Contents come from the TEST_FILE_CONTENTS constant; each file is written
+    in one call, with the writes fanned out across a small thread pool so
+    their syscall latency overlaps (write_text releases the GIL). With
+    base_dir set, files are created there (typically a memory-backed
+    temporary directory) instead of the working directory. Scenarios with
+    identical content are deduplicated: only the first copy is written,
+    later ones become symlinks to it, so concurrent scheduler processes
+    share one inode and page-cache entry.
+
+    Args:
+        base_dir: Optional directory to create the files in
+
+    Returns:
+        Dictionary mapping test file identifiers to their file paths
+    """
+    test_files = {}
+    seen: Dict[str, str] = {}  # content -> path already written
+    writes: List[Tuple[str, str]] = []    # (path, content) for unique files
+    links: List[Tuple[str, str]] = []     # (target basename, link path)
+    for key, (path, content) in TEST_FILE_CONTENTS.items():
+        if base_dir is not None:
+            path = os.path.join(base_dir, path)
+        existing = seen.get(content)
+        if existing is not None:
+            links.append((os.path.basename(existing), path))
+        else:
+            writes.append((path, content))
+            seen[content] = path
+        test_files[key] = path
 
+    def write_file(job: Tuple[str, str]) -> None:
+        Path(job[0]).write_text(job[1])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write_file, writes))
+
+    # Symlinks are created after the writes so every target already exists
+    for target, path in links:
+        Path(path).unlink(missing_ok=True)  # symlink() fails on leftovers
+        os.symlink(target, path)
 
     return test_files
 
 
-def cleanup_test_files(test_files: Dict[str, str], keep_files: bool = False) -> None:
+# --- Test Case Definitions ---
+
+def columnar_section(rows: List[Dict[str, Value]]) -> Dict[str, Tuple[Value, ...]]:
     """
-    Clean up generated test files.
-    
+    Pivot a list of row dictionaries into column-oriented (Section) form.
+
     Args:
-        test_files: Dictionary of test file paths to remove
-        keep_files: If True, files will not be removed
+        rows: Section rows as loaded from the JSON sidecar
+
+    Returns:
+        Dictionary mapping each column name to a tuple of its values
     """
-    if keep_files:
-        print(f"{COLOR_YELLOW}Keeping generated test files as requested{COLOR_RESET}")
-        return
-        
-    print("Cleaning up generated test files...")
-    for filepath in test_files.values():
-        try:
-            os.remove(filepath)
-            print(f"  Removed {filepath}")
-        except OSError:
-            pass  # Ignore if file doesn't exist
+    if not rows:
+        return {}
+    return {col: tuple(row[col] for row in rows) for col in rows[0]}
 
 
-# --- Test Case Definitions ---
+@functools.lru_cache(maxsize=None)
+def load_expected_entries() -> Tuple[Dict[str, Any], ...]:
+    """
+    Load the expected-results sidecar, once per process.
+
+    Expected sections are pivoted into the same column-oriented form
+    parse_all_csv produces, so compare_results can check each column with a
+    single tuple comparison instead of re-collecting values from row dicts on
+    every call. The entries are read-only after loading, so repeated
+    define_test_cases calls share the one parsed copy.
+
+    Returns:
+        Tuple of expected-result entry dictionaries
+    """
+    with open(EXPECTED_RESULTS_FILE, 'rb') as f:
+        entries = json.load(f)
+    for entry in entries:
+        entry['expected'] = {section: columnar_section(rows)
+                             for section, rows in entry['expected'].items()}
+    return tuple(entries)
+
 
 def define_test_cases(test_files: Dict[str, str]) -> List[TestCase]:
     """
     Define all test cases with their expected results.
-    
+
+    Expected results live in the sidecar expected_results.json next to this
+    script; json.load parses them in C, so the interpreter never has to
+    compile the hundreds of literal dicts the old inline table needed. The
+    JSON already stores numeric values as numbers, so no further type
+    conversion is required.
+
     Args:
         test_files: Dictionary mapping test file identifiers to their file paths
-        
+
     Returns:
         List of test case tuples
     """
-    # Organize test cases by algorithm for better readability
-    fcfs_tests = [
-        # FCFS with 1 CPU
-        (
-            "FCFS_1CPU", "FCFS", 1, 0, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '5', 'Turnaround': '5', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '5', 'Finish': '8', 'Turnaround': '6', 'Waiting': '3', 'Response': '3'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '8', 'Finish': '10', 'Turnaround': '6', 'Waiting': '4', 'Response': '4'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '10', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '5.67', 'AvgWaiting': '2.33', 'AvgResponse': '2.33'}
-                ]
-            }
-        ),
-        # FCFS with 2 CPUs
-        (
-            "FCFS_2CPU", "FCFS", 2, 0, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '5', 'Turnaround': '5', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '2', 'Finish': '5', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '5', 'Finish': '7', 'Turnaround': '3', 'Waiting': '1', 'Response': '1'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '7', 'IdleTime': '0', 'Utilization%': '100.00'},
-                    {'CPU_ID': '1', 'BusyTime': '3', 'IdleTime': '4', 'Utilization%': '42.86'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '3.67', 'AvgWaiting': '0.33', 'AvgResponse': '0.33'}
-                ]
-            }
-        ),
-        # FCFS with simultaneous arrivals
-        (
-            "FCFS_SIMULTANEOUS", "FCFS", 1, 0, test_files['simultaneous'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '4', 'Priority': '2', 'Start': '2', 'Finish': '6', 'Turnaround': '6', 'Waiting': '2', 'Response': '2'},
-                    {'PID': '2', 'Arrival': '0', 'Burst': '3', 'Priority': '1', 'Start': '6', 'Finish': '9', 'Turnaround': '9', 'Waiting': '6', 'Response': '6'},
-                    {'PID': '3', 'Arrival': '0', 'Burst': '2', 'Priority': '3', 'Start': '0', 'Finish': '2', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [{'CPU_ID': '0', 'BusyTime': '9', 'IdleTime': '0', 'Utilization%': '100.00'}],
-                'average': [{'AvgTurnaround': '5.67', 'AvgWaiting': '2.67', 'AvgResponse': '2.67'}]
-            }
-        ),
-        # FCFS longer scenario
-        (
-            "FCFS_Scenario2", "FCFS", 1, 0, test_files['scenario_two'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '8', 'Priority': '2', 'Start': '0', 'Finish': '8', 'Turnaround': '8', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '1', 'Burst': '2', 'Priority': '3', 'Start': '8', 'Finish': '10', 'Turnaround': '9', 'Waiting': '7', 'Response': '7'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '4', 'Priority': '1', 'Start': '10', 'Finish': '14', 'Turnaround': '12', 'Waiting': '8', 'Response': '8'},
-                    {'PID': '4', 'Arrival': '3', 'Burst': '6', 'Priority': '2', 'Start': '14', 'Finish': '20', 'Turnaround': '17', 'Waiting': '11', 'Response': '11'},
-                    {'PID': '5', 'Arrival': '4', 'Burst': '7', 'Priority': '3', 'Start': '20', 'Finish': '27', 'Turnaround': '23', 'Waiting': '16', 'Response': '16'},
-                    {'PID': '6', 'Arrival': '5', 'Burst': '5', 'Priority': '1', 'Start': '27', 'Finish': '32', 'Turnaround': '27', 'Waiting': '22', 'Response': '22'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '32', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '16.00', 'AvgWaiting': '10.67', 'AvgResponse': '10.67'}
-                ]
-            }
-        ),
-        # FCFS priority inversion test
-        (
-            "FCFS_PRIORITY_INVERSION", "FCFS", 1, 0, test_files['priority_inversion'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '6', 'Priority': '1', 'Start': '0', 'Finish': '6', 'Turnaround': '6', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '1', 'Burst': '2', 'Priority': '5', 'Start': '6', 'Finish': '8', 'Turnaround': '7', 'Waiting': '5', 'Response': '5'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '3', 'Priority': '4', 'Start': '8', 'Finish': '11', 'Turnaround': '9', 'Waiting': '6', 'Response': '6'},
-                    {'PID': '4', 'Arrival': '3', 'Burst': '1', 'Priority': '3', 'Start': '11', 'Finish': '12', 'Turnaround': '9', 'Waiting': '8', 'Response': '8'},
-                    {'PID': '5', 'Arrival': '4', 'Burst': '2', 'Priority': '2', 'Start': '12', 'Finish': '14', 'Turnaround': '10', 'Waiting': '8', 'Response': '8'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '14', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '8.20', 'AvgWaiting': '5.40', 'AvgResponse': '5.40'}
-                ]
-            }
-        ),
-                # FCFS with initial idle gap
-        (
-            "FCFS_IDLE_GAP_1CPU", "FCFS", 1, 0, test_files['idle_gap'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '3', 'Burst': '2', 'Priority': '1', 'Start': '3', 'Finish': '5', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '5', 'Burst': '1', 'Priority': '1', 'Start': '5', 'Finish': '6', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '3', 'IdleTime': '3', 'Utilization%': '50.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '1.50', 'AvgWaiting': '0.00', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-        # FCFS with more CPUs than processes (simultaneous arrivals)
-        (
-            "FCFS_4CPU_FEW_PROCS", "FCFS", 4, 0, test_files['few_procs_many_cpus'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '4', 'Priority': '1', 'Start': '0', 'Finish': '4', 'Turnaround': '4', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '0', 'Burst': '2', 'Priority': '2', 'Start': '0', 'Finish': '2', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '0', 'Burst': '1', 'Priority': '3', 'Start': '0', 'Finish': '1', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '1', 'IdleTime': '3', 'Utilization%': '25.00'},
-                    {'CPU_ID': '1', 'BusyTime': '2', 'IdleTime': '2', 'Utilization%': '50.00'},
-                    {'CPU_ID': '2', 'BusyTime': '4', 'IdleTime': '0', 'Utilization%': '100.00'},
-                    {'CPU_ID': '3', 'BusyTime': '0', 'IdleTime': '4', 'Utilization%': '0.00'},
-                ],
-                'average': [
-                    {'AvgTurnaround': '2.33', 'AvgWaiting': '0.00', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-        # FCFS with unsorted input file (must schedule by arrival, not file order)
-        (
-            "FCFS_UNSORTED_INPUT", "FCFS", 1, 0, test_files['unsorted_arrivals'],
-            {
-               'process': [
-                    {'PID': '2', 'Arrival': '5', 'Burst': '1', 'Priority': '1', 'Start': '5', 'Finish': '6', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '1', 'Arrival': '0', 'Burst': '3', 'Priority': '1', 'Start': '0', 'Finish': '3', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '2', 'Priority': '1', 'Start': '3', 'Finish': '5', 'Turnaround': '3', 'Waiting': '1', 'Response': '1'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '6', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '2.33', 'AvgWaiting': '0.33', 'AvgResponse': '0.33'}
-                ]
-            }
-        ),
-
-    ]
-
-    sjf_tests = [
-        # SJF with 1 CPU
-        (
-            "SJF_1CPU", "SJF", 1, 0, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '5', 'Turnaround': '5', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '7', 'Finish': '10', 'Turnaround': '8', 'Waiting': '5', 'Response': '5'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '5', 'Finish': '7', 'Turnaround': '3', 'Waiting': '1', 'Response': '1'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '10', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '5.33', 'AvgWaiting': '2.00', 'AvgResponse': '2.00'}
-                ]
-            }
-        ),
-        # SJF with ties
-        (
-            "SJF_TIES", "SJF", 1, 0, test_files['ties'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '3', 'Priority': '1', 'Start': '6', 'Finish': '9', 'Turnaround': '9', 'Waiting': '6', 'Response': '6'},
-                    {'PID': '2', 'Arrival': '0', 'Burst': '3', 'Priority': '2', 'Start': '3', 'Finish': '6', 'Turnaround': '6', 'Waiting': '3', 'Response': '3'},
-                    {'PID': '3', 'Arrival': '0', 'Burst': '3', 'Priority': '3', 'Start': '0', 'Finish': '3', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [{'CPU_ID': '0', 'BusyTime': '9', 'IdleTime': '0', 'Utilization%': '100.00'}],
-                'average': [{'AvgTurnaround': '6.00', 'AvgWaiting': '3.00', 'AvgResponse': '3.00'}]
-            }
-        ),
-                # SJF with initial idle gap
-        (
-            "SJF_IDLE_GAP_1CPU", "SJF", 1, 0, test_files['idle_gap'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '3', 'Burst': '2', 'Priority': '1', 'Start': '3', 'Finish': '5', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '5', 'Burst': '1', 'Priority': '1', 'Start': '5', 'Finish': '6', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '3', 'IdleTime': '3', 'Utilization%': '50.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '1.50', 'AvgWaiting': '0.00', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-        # SJF tie on burst length: break tie by priority, then PID
-        (
-            "SJF_TIE_PRIORITY_PID", "SJF", 1, 0, test_files['sjf_tie_priority'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '3', 'Priority': '1', 'Start': '4', 'Finish': '7', 'Turnaround': '7', 'Waiting': '4', 'Response': '4'},
-                    {'PID': '2', 'Arrival': '0', 'Burst': '3', 'Priority': '5', 'Start': '1', 'Finish': '4', 'Turnaround': '4', 'Waiting': '1', 'Response': '1'},
-                    {'PID': '3', 'Arrival': '0', 'Burst': '1', 'Priority': '2', 'Start': '0', 'Finish': '1', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '7', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '4.00', 'AvgWaiting': '1.67', 'AvgResponse': '1.67'}
-                ]
-            }
-        ),
-
-    ]
-
-    srtf_tests = [
-        # SRTF with 1 CPU
-        (
-            "SRTF_1CPU", "SRTF", 1, 0, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '10', 'Turnaround': '10', 'Waiting': '5', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '2', 'Finish': '5', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '5', 'Finish': '7', 'Turnaround': '3', 'Waiting': '1', 'Response': '1'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '10', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '5.33', 'AvgWaiting': '2.00', 'AvgResponse': '0.33'}
-                ]
-            }
-        ),
-        # SRTF with 2 CPUs
-        (
-            "SRTF_2CPU", "SRTF", 2, 0, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '5', 'Turnaround': '5', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '2', 'Finish': '5', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '5', 'Finish': '7', 'Turnaround': '3', 'Waiting': '1', 'Response': '1'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '7', 'IdleTime': '0', 'Utilization%': '100.00'},
-                    {'CPU_ID': '1', 'BusyTime': '3', 'IdleTime': '4', 'Utilization%': '42.86'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '3.67', 'AvgWaiting': '0.33', 'AvgResponse': '0.33'}
-                ]
-            }
-        ),
-        # SRTF with priority
-        (
-            "SRTF_1CPU_Priority", "SRTF", 1, 0, test_files['priority'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '2', 'Start': '0', 'Finish': '5', 'Turnaround': '5', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '1', 'Start': '7', 'Finish': '10', 'Turnaround': '8', 'Waiting': '5', 'Response': '5'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '4', 'Priority': '3', 'Start': '10', 'Finish': '14', 'Turnaround': '12', 'Waiting': '8', 'Response': '8'},
-                    {'PID': '4', 'Arrival': '5', 'Burst': '2', 'Priority': '2', 'Start': '5', 'Finish': '7', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '14', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '6.75', 'AvgWaiting': '3.25', 'AvgResponse': '3.25'}
-                ]
-            }
-        ),
-        # SRTF with many short jobs (starvation test)
-        (
-            "SRTF_SHORT_JOBS", "SRTF", 1, 0, test_files['short_jobs'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '10', 'Priority': '2', 'Start': '0', 'Finish': '21', 'Turnaround': '21', 'Waiting': '11', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '1', 'Burst': '12', 'Priority': '1', 'Start': '21', 'Finish': '33', 'Turnaround': '32', 'Waiting': '20', 'Response': '20'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '1', 'Priority': '3', 'Start': '2', 'Finish': '3', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '4', 'Arrival': '3', 'Burst': '2', 'Priority': '2', 'Start': '3', 'Finish': '6', 'Turnaround': '3', 'Waiting': '1', 'Response': '0'},
-                    {'PID': '5', 'Arrival': '4', 'Burst': '1', 'Priority': '3', 'Start': '4', 'Finish': '5', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '6', 'Arrival': '5', 'Burst': '1', 'Priority': '1', 'Start': '6', 'Finish': '7', 'Turnaround': '2', 'Waiting': '1', 'Response': '1'},
-                    {'PID': '7', 'Arrival': '6', 'Burst': '2', 'Priority': '2', 'Start': '8', 'Finish': '10', 'Turnaround': '4', 'Waiting': '2', 'Response': '2'},
-                    {'PID': '8', 'Arrival': '7', 'Burst': '1', 'Priority': '3', 'Start': '7', 'Finish': '8', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '9', 'Arrival': '8', 'Burst': '2', 'Priority': '1', 'Start': '11', 'Finish': '13', 'Turnaround': '5', 'Waiting': '3', 'Response': '3'},
-                    {'PID': '10', 'Arrival': '9', 'Burst': '1', 'Priority': '2', 'Start': '10', 'Finish': '11', 'Turnaround': '2', 'Waiting': '1', 'Response': '1'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '33', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '7.20', 'AvgWaiting': '3.90', 'AvgResponse': '2.70'}
-                ]
-            }
-        ),
-        # SRTF priority inversion test
-        (
-            "SRTF_PRIORITY_INVERSION", "SRTF", 1, 0, test_files['priority_inversion'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '6', 'Priority': '1', 'Start': '0', 'Finish': '14', 'Turnaround': '14', 'Waiting': '8', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '1', 'Burst': '2', 'Priority': '5', 'Start': '1', 'Finish': '3', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '3', 'Priority': '4', 'Start': '6', 'Finish': '9', 'Turnaround': '7', 'Waiting': '4', 'Response': '4'},
-                    {'PID': '4', 'Arrival': '3', 'Burst': '1', 'Priority': '3', 'Start': '3', 'Finish': '4', 'Turnaround': '1', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '5', 'Arrival': '4', 'Burst': '2', 'Priority': '2', 'Start': '4', 'Finish': '6', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '14', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '5.20', 'AvgWaiting': '2.40', 'AvgResponse': '0.80'}
-                ]
-            }
-        ),
-                # SRTF preemption chain (multiple preempts)
-        (
-            "SRTF_PREEMPT_CHAIN", "SRTF", 1, 0, test_files['srtf_preempt_chain'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '8', 'Priority': '1', 'Start': '0', 'Finish': '14', 'Turnaround': '14', 'Waiting': '6', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '1', 'Burst': '4', 'Priority': '1', 'Start': '1', 'Finish': '7', 'Turnaround': '6', 'Waiting': '2', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '2', 'Burst': '2', 'Priority': '1', 'Start': '2', 'Finish': '4', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '14', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '7.33', 'AvgWaiting': '2.67', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-        # SRTF tie on remaining time: priority breaks tie, then PID
-        (
-            "SRTF_TIE_REMAIN_PRIORITY", "SRTF", 1, 0, test_files['srtf_equal_remaining'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '4', 'Priority': '1', 'Start': '0', 'Finish': '7', 'Turnaround': '7', 'Waiting': '3', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '1', 'Burst': '3', 'Priority': '5', 'Start': '1', 'Finish': '4', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '7', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '5.00', 'AvgWaiting': '1.50', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-        # SRTF single process arrives late (idle time + start/finish correctness)
-        (
-            "SRTF_SINGLE_LATE", "SRTF", 1, 0, test_files['single_late'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '5', 'Burst': '3', 'Priority': '1', 'Start': '5', 'Finish': '8', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '3', 'IdleTime': '5', 'Utilization%': '37.50'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '3.00', 'AvgWaiting': '0.00', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-    ]
-
-    rr_tests = [
-        # RR with quantum 2
-        (
-            "RR_1CPU_Q2", "RR", 1, 2, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '10', 'Turnaround': '10', 'Waiting': '5', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '2', 'Finish': '9', 'Turnaround': '7', 'Waiting': '4', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '6', 'Finish': '8', 'Turnaround': '4', 'Waiting': '2', 'Response': '2'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '10', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '7.00', 'AvgWaiting': '3.67', 'AvgResponse': '0.67'}
-                ]
-            }
-        ),
-        # RR with large quantum (should behave like FCFS)
-        (
-            "RR_1CPU_Q10", "RR", 1, 10, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '5', 'Turnaround': '5', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '5', 'Finish': '8', 'Turnaround': '6', 'Waiting': '3', 'Response': '3'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '8', 'Finish': '10', 'Turnaround': '6', 'Waiting': '4', 'Response': '4'}
-                ],
-                'cpu': [{'CPU_ID': '0', 'BusyTime': '10', 'IdleTime': '0', 'Utilization%': '100.00'}],
-                'average': [{'AvgTurnaround': '5.67', 'AvgWaiting': '2.33', 'AvgResponse': '2.33'}]
-            }
-        ),
-        # RR with 2 CPUs
-        (
-            "RR_2CPU_Q2", "RR", 2, 2, test_files['basic'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '5', 'Priority': '1', 'Start': '0', 'Finish': '6', 'Turnaround': '6', 'Waiting': '1', 'Response': '0'},
-                    {'PID': '2', 'Arrival': '2', 'Burst': '3', 'Priority': '2', 'Start': '2', 'Finish': '5', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                    {'PID': '3', 'Arrival': '4', 'Burst': '2', 'Priority': '1', 'Start': '4', 'Finish': '6', 'Turnaround': '2', 'Waiting': '0', 'Response': '0'}
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '6', 'IdleTime': '0', 'Utilization%': '100.00'},
-                    {'CPU_ID': '1', 'BusyTime': '4', 'IdleTime': '2', 'Utilization%': '66.67'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '3.67', 'AvgWaiting': '0.33', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-                # RR quantum=1 with simultaneous arrivals (stress switching + tie-breaking)
-        (
-            "RR_1CPU_Q1_SIMUL", "RR", 1, 1, test_files['rr_q1_simul'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '0', 'Burst': '2', 'Priority': '1', 'Start': '1', 'Finish': '4', 'Turnaround': '4', 'Waiting': '2', 'Response': '1'},
-                    {'PID': '2', 'Arrival': '0', 'Burst': '2', 'Priority': '2', 'Start': '0', 'Finish': '3', 'Turnaround': '3', 'Waiting': '1', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '4', 'IdleTime': '0', 'Utilization%': '100.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '3.50', 'AvgWaiting': '1.50', 'AvgResponse': '0.50'}
-                ]
-            }
-        ),
-
-        # RR with idle gap then multi-quantum completion
-        (
-            "RR_1CPU_IDLE_GAP_Q2", "RR", 1, 2, test_files['rr_idle_single'],
-            {
-                'process': [
-                    {'PID': '1', 'Arrival': '3', 'Burst': '3', 'Priority': '1', 'Start': '3', 'Finish': '6', 'Turnaround': '3', 'Waiting': '0', 'Response': '0'},
-                ],
-                'cpu': [
-                    {'CPU_ID': '0', 'BusyTime': '3', 'IdleTime': '3', 'Utilization%': '50.00'}
-                ],
-                'average': [
-                    {'AvgTurnaround': '3.00', 'AvgWaiting': '0.00', 'AvgResponse': '0.00'}
-                ]
-            }
-        ),
-
-    ]
-
-    # Combine all tests
-    return fcfs_tests + sjf_tests + srtf_tests + rr_tests
-
-
-def run_tests(executable_path: str, tests: List[TestCase], verbose: bool = False) -> Tuple[int, int]:
+    return [(entry['name'], entry['algorithm'], entry['cpus'], entry['quantum'],
+             test_files[entry['file']], entry['expected'])
+            for entry in load_expected_entries()]
+
+
+# Banner template built once at import; per-test calls do a single
+# C-implemented .format() instead of re-assembling the color codes.
+_HEADER_TMPL = (f"\n{Colors.YELLOW}--- Test: {{name}} ({{algo}}, {{cpus}} CPU(s), "
+                f"Q={{q}}) ---{Colors.RESET}")
+
+
+def test_header(test: TestCase) -> str:
+    """Build the banner line announcing a test case."""
+    name, algo, cpus, quantum = test[0], test[1], test[2], test[3]
+    return _HEADER_TMPL.format(name=name, algo=algo, cpus=cpus,
+                               q=quantum if algo == 'RR' else 'N/A')
+
+
+def evaluate_test(test: TestCase, output_lines: List[str], report: List[str]) -> Tuple[str, bool, List[str]]:
     """
-    Run multiple scheduler tests and report results.
-    
+    Parse one test's scheduler output and compare it to the expected results.
+
+    Args:
+        test: The test case tuple being evaluated
+        output_lines: The scheduler stdout lines belonging to this test
+        report: Report list to append pass/fail messages to
+
+    Returns:
+        Tuple containing (test_name, passed, report_lines)
+    """
+    name, expected = test[0], test[5]
+
+    actual_results = parse_all_csv(output_lines, report)
+    if actual_results is None:
+        report.append(red(">>> TEST FAILED (CSV parsing error)"))
+        return name, False, report
+
+    mismatches = compare_results(actual_results, expected)
+
+    if not mismatches:
+        report.append(green(bold(">>> TEST PASSED")))
+        return name, True, report
+
+    report.append(red(bold(">>> TEST FAILED")))
+    report.append(red("Mismatches found:"))
+    for mismatch in mismatches:
+        report.append(f"  - {mismatch}")
+    return name, False, report
+
+
+def run_single_test(executable_path: str, test: TestCase, verbose: bool = False) -> Tuple[str, bool, List[str]]:
+    """
+    Run one test case end-to-end: execute, parse, and compare.
+
+    Designed to be submitted to a thread pool; all messages are collected into
+    a report list rather than printed so workers don't interleave output.
+
+    Args:
+        executable_path: Path to the scheduler executable
+        test: The test case tuple to run
+        verbose: Whether to include detailed scheduler output in the report
+
+    Returns:
+        Tuple containing (test_name, passed, report_lines)
+    """
+    name, algo, cpus, quantum, infile = test[0], test[1], test[2], test[3], test[4]
+    report = [test_header(test)]
+
+    output = run_scheduler(executable_path, algo, cpus, quantum, infile, verbose, report)
+    if output is None:
+        report.append(red(">>> TEST FAILED (Scheduler execution error)"))
+        return name, False, report
+
+    return evaluate_test(test, output, report)
+
+
+def split_batched_output(output_lines: List[str]) -> Optional[List[List[str]]]:
+    """
+    Split a batched scheduler run into one output chunk per input file.
+
+    The scheduler prints a '--- BEGIN TEST <file> ---' marker before each run
+    when given a comma-separated file list. Returns the per-run chunks in
+    order, or None if no markers were found (scheduler lacks batch support).
+
+    Args:
+        output_lines: The stdout lines from a batched scheduler invocation
+
+    Returns:
+        List of per-file output line chunks, or None
+    """
+    sections = []
+    current = None
+    for line in output_lines:
+        if line.startswith(BATCH_MARKER):
+            current = []
+            sections.append(current)
+        elif current is not None:
+            current.append(line)
+    return sections or None
+
+
+def run_test_group(executable_path: str, tests: List[TestCase],
+                   verbose: bool = False) -> List[Tuple[str, bool, List[str]]]:
+    """
+    Run a group of test cases sharing (algorithm, cpus, quantum) in one
+    scheduler invocation, amortizing process-spawn overhead across the group.
+
+    Falls back to one invocation per test if the batched run fails or the
+    scheduler does not emit the batch markers.
+
+    Args:
+        executable_path: Path to the scheduler executable
+        tests: Test case tuples that all share algorithm, cpus, and quantum
+        verbose: Whether to include detailed scheduler output in the reports
+
+    Returns:
+        List of (test_name, passed, report_lines) tuples, one per test
+    """
+    if len(tests) == 1:
+        return [run_single_test(executable_path, tests[0], verbose)]
+
+    algo, cpus, quantum = tests[0][1], tests[0][2], tests[0][3]
+    files = [test[4] for test in tests]
+    batch_report: List[str] = []
+    output = run_scheduler(executable_path, algo, cpus, quantum, files, verbose, batch_report)
+
+    sections = split_batched_output(output) if output is not None else None
+    if sections is None or len(sections) != len(tests):
+        # Batched run failed or scheduler lacks batch support; pay the
+        # per-test spawn cost instead.
+        return [run_single_test(executable_path, test, verbose) for test in tests]
+
+    results = []
+    for i, (test, section) in enumerate(zip(tests, sections)):
+        # Attach the group-level messages (command line, errors) to the
+        # first test's report so they are printed exactly once.
+        report = batch_report if i == 0 else []
+        report.insert(0, test_header(test))
+        results.append(evaluate_test(test, section, report))
+    return results
+
+
+def run_tests(executable_path: str, tests: List[TestCase], verbose: bool = False,
+              batch: bool = False) -> Tuple[int, int]:
+    """
+    Run multiple scheduler tests in parallel and report results.
+
+    Test cases are independent and the workload is dominated by subprocess
+    spawn + scheduler execution, so they are fanned out across a thread pool
+    (subprocess calls release the GIL). Reports are printed in submission
+    order so the output is deterministic and diffable across runs. With
+    batch=True, tests sharing (algorithm, cpus, quantum) are combined into a
+    single scheduler invocation per group.
+
     Args:
         executable_path: Path to the scheduler executable
         tests: List of test case tuples to run
         verbose: Whether to show detailed scheduler output
-        
+        batch: Whether to batch compatible tests into one invocation
+
     Returns:
         Tuple containing (passed_count, total_count)
     """
     total_tests = len(tests)
     passed_tests = 0
 
-    print(f"{COLOR_CYAN}--- Running {total_tests} Test Cases ---{COLOR_RESET}")
+    print(cyan(f"--- Running {total_tests} Test Cases ---"))
 
-    for name, algo, cpus, quantum, infile, expected in tests:
-        print(f"\n{COLOR_YELLOW}--- Test: {name} ({algo}, {cpus} CPU(s), "
-              f"Q={quantum if algo=='RR' else 'N/A'}) ---{COLOR_RESET}")
+    if batch:
+        group_key = lambda test: (test[1], test[2], test[3])
+        groups = [list(group) for _, group in
+                  itertools.groupby(sorted(tests, key=group_key), key=group_key)]
+    else:
+        groups = [[test] for test in tests]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(run_test_group, executable_path, group, verbose)
+                   for group in groups]
+        for future in futures:
+            for name, passed, report in future.result():
+                if passed:
+                    passed_tests += 1
+                with _print_lock:
+                    for line in report:
+                        print(line)
 
-        # Run scheduler
-        output = run_scheduler(executable_path, algo, cpus, quantum, infile, verbose)
-        if output is None:
-            print(f"{COLOR_RED}>>> TEST FAILED (Scheduler execution error){COLOR_RESET}")
-            continue
+    return passed_tests, total_tests
 
-        # Parse results
-        actual_results = parse_all_csv(output)
-        if actual_results is None:
-            print(f"{COLOR_RED}>>> TEST FAILED (CSV parsing error){COLOR_RESET}")
-            continue
 
-        # Compare results
-        mismatches = compare_results(actual_results, expected)
+def run_tests_repl(executable_path: str, tests: List[TestCase],
+                   verbose: bool = False) -> Tuple[int, int]:
+    """
+    Run all tests through one long-lived scheduler process in REPL mode.
+
+    The scheduler is started once with --repl and the full manifest of
+    '<algorithm> <cpus> <quantum> <file>' commands is written to its stdin up
+    front; each case's output ends with an '--- END CASE ---' sentinel. This
+    pays the fork/exec and libc startup cost once for the whole suite, and
+    because the commands are not fed in lockstep the scheduler simulates
+    ahead in the pipe while Python parses earlier cases. Falls back to the
+    one-shot path for the remaining tests if the scheduler does not support
+    --repl or exits mid-run.
+
+    Args:
+        executable_path: Path to the scheduler executable
+        tests: List of test case tuples to run
+        verbose: Whether to show detailed scheduler output
+
+    Returns:
+        Tuple containing (passed_count, total_count)
+    """
+    total_tests = len(tests)
+    passed_tests = 0
+
+    print(cyan(f"--- Running {total_tests} Test Cases (REPL mode) ---"))
+
+    proc = subprocess.Popen([executable_path, '--repl'], stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, bufsize=1)
+
+    # Write the whole manifest and close stdin before reading anything back;
+    # the pipe decouples the two sides, so no per-command round trip occurs.
+    try:
+        for test in tests:
+            proc.stdin.write(f"{test[1]} {test[2]} {test[3]} {test[4]}\n")
+        proc.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass  # Scheduler exited early; the short read below handles it.
+
+    try:
+        for index, test in enumerate(tests):
+            report = [test_header(test)]
+            output_lines: Optional[List[str]] = []
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if line == REPL_SENTINEL:
+                    break
+                output_lines.append(line)
+            else:
+                # EOF before the sentinel: the scheduler exited, either
+                # because it predates --repl support or because it crashed.
+                output_lines = None
+
+            if output_lines is None:
+                print(yellow("Scheduler REPL mode unavailable; "
+                             "falling back to one-shot runs."))
+                rest_passed, _ = run_tests(executable_path, tests[index:], verbose)
+                return passed_tests + rest_passed, total_tests
+
+            if verbose:
+                report.append("\nScheduler Output:")
+                report.append("-" * 40)
+                report.append('\n'.join(output_lines))
+                report.append("-" * 40)
+
+            _, passed, report = evaluate_test(test, output_lines, report)
+            if passed:
+                passed_tests += 1
+            for line in report:
+                print(line)
+    finally:
+        if not proc.stdin.closed:
+            proc.stdin.close()
+        proc.wait()
 
-        if not mismatches:
-            print(f"{COLOR_GREEN}{COLOR_BOLD}>>> TEST PASSED{COLOR_RESET}")
-            passed_tests += 1
-        else:
-            print(f"{COLOR_RED}{COLOR_BOLD}>>> TEST FAILED{COLOR_RESET}")
-            print(f"{COLOR_RED}Mismatches found:{COLOR_RESET}")
-            for mismatch in mismatches:
-                print(f"  - {mismatch}")
-                
     return passed_tests, total_tests
 
 
@@ -1033,18 +1049,33 @@ def main() -> None:
                         help="Run only tests for specified algorithm")
     parser.add_argument('--test', help="Run only the specified test by name")
     parser.add_argument('--verbose', action='store_true', help="Show detailed scheduler output")
+    parser.add_argument('--batch', action='store_true',
+                        help="Batch tests sharing algorithm/cpus/quantum into one scheduler invocation")
+    parser.add_argument('--repl', action='store_true',
+                        help="Drive all tests through one persistent scheduler process (--repl mode)")
     parser.add_argument('--no-cleanup', action='store_true', help="Keep generated test files")
     args = parser.parse_args()
 
     executable_path = args.executable
 
-    if not os.path.exists(executable_path):
-        print(f"{COLOR_RED}Error: Executable '{executable_path}' not found.{COLOR_RESET}")
+    if not os.access(executable_path, os.X_OK):
+        print(red(f"Error: Executable '{executable_path}' not found or not executable."))
         print("Please compile the C code (e.g., gcc scheduler.c -o scheduler -lm) or provide the correct path.")
         return
 
-    # Create all test files
-    test_files = create_test_files()
+    # Create all test files. By default they go into a temporary directory
+    # that self-cleans when the run ends, preferring /dev/shm (RAM-backed
+    # tmpfs on Linux) so the inputs never touch the disk; --no-cleanup
+    # writes them to the working directory and keeps them.
+    tmpdir = None
+    if args.no_cleanup:
+        test_files = create_test_files()
+    else:
+        shm = '/dev/shm'
+        tmpdir = tempfile.TemporaryDirectory(
+            prefix='scheduler_tests_',
+            dir=shm if os.path.isdir(shm) else None)
+        test_files = create_test_files(tmpdir.name)
     
     # Define all test cases
     all_tests = define_test_cases(test_files)
@@ -1054,25 +1085,34 @@ def main() -> None:
     if args.algorithm:
         tests_to_run = [tc for tc in all_tests if tc[1] == args.algorithm]
         if not tests_to_run:
-            print(f"{COLOR_RED}No tests found for algorithm '{args.algorithm}'{COLOR_RESET}")
+            print(red(f"No tests found for algorithm '{args.algorithm}'"))
             return
             
     if args.test:
-        tests_to_run = [tc for tc in tests_to_run if tc[0] == args.test]
-        if not tests_to_run:
-            print(f"{COLOR_RED}No test found with name '{args.test}'{COLOR_RESET}")
+        # Names are unique, so index once and look up instead of scanning
+        tests_by_name = {tc[0]: tc for tc in tests_to_run}
+        test_case = tests_by_name.get(args.test)
+        if test_case is None:
+            print(red(f"No test found with name '{args.test}'"))
             return
+        tests_to_run = [test_case]
     
     # Run the filtered tests
-    passed, total = run_tests(executable_path, tests_to_run, args.verbose)
+    if args.repl:
+        passed, total = run_tests_repl(executable_path, tests_to_run, args.verbose)
+    else:
+        passed, total = run_tests(executable_path, tests_to_run, args.verbose, args.batch)
     
     # Print summary
-    print(f"\n{COLOR_CYAN}--- Test Summary ---{COLOR_RESET}")
-    summary_color = COLOR_GREEN if passed == total else COLOR_RED
-    print(f"{summary_color}{COLOR_BOLD}Passed: {passed}/{total}{COLOR_RESET}")
+    print("\n" + cyan("--- Test Summary ---"))
+    colorize = green if passed == total else red
+    print(colorize(bold(f"Passed: {passed}/{total}")))
     
     # Clean up test files
-    cleanup_test_files(test_files, args.no_cleanup)
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    else:
+        print(yellow("Keeping generated test files as requested"))
 
 
 if __name__ == "__main__":